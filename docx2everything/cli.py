@@ -3,6 +3,7 @@ Command-line interface for docx2everything.
 """
 
 import argparse
+import io
 import os
 import sys
 from .core import process, process_to_markdown
@@ -52,9 +53,14 @@ def main():
     Main entry point for CLI.
     """
     args = process_args()
+    output = getattr(sys.stdout, 'buffer', sys.stdout)
     if args.markdown:
-        text = process_to_markdown(args.docx, args.img_dir)
+        # Stream markdown straight into stdout's byte buffer so the
+        # output is never materialized twice (text + encoded bytes)
+        writer = io.TextIOWrapper(output, encoding='utf-8', write_through=True)
+        process_to_markdown(args.docx, args.img_dir, out=writer)
+        writer.flush()
+        writer.detach()  # Leave stdout open for the interpreter
     else:
         text = process(args.docx, args.img_dir)
-    output = getattr(sys.stdout, 'buffer', sys.stdout)
-    output.write(text.encode('utf-8'))
+        output.write(text.encode('utf-8'))
@@ -3,65 +3,183 @@ Markdown converter for DOCX files.
 Converts DOCX structures (tables, lists, headings, formatting) to markdown.
 """
 
+import functools
 import os
 import re
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import qn, NSMAP
+from collections import namedtuple
+from itertools import groupby
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ..utils.xml_utils import (
+    qn,
+    NSMAP,
+    HAVE_LXML as _HAVE_LXML,
+    fromstring as _fromstring,
+    iterparse as _iterparse,
+)
 from ..parsers.relationship_parser import parse_relationships
 from ..parsers.numbering_parser import parse_numbering_xml
 from ..parsers.footnote_parser import parse_footnotes_xml, parse_endnotes_xml
 from ..parsers.comment_parser import parse_comments_xml
 from ..parsers.style_parser import parse_styles_xml
 from ..parsers.chart_parser import parse_all_charts
-from ..utils.file_utils import extract_images
+from ..utils.file_utils import extract_images, infos_by_name, read_members_parallel
+
+# Precomputed Clark-notation tag names. qn() is cheap but these are used
+# inside per-run/per-paragraph loops, so resolve them once at import time.
+_W_BODY = qn('w:body')
+_W_P = qn('w:p')
+_W_TBL = qn('w:tbl')
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_TCPR = qn('w:tcPr')
+_W_GRIDSPAN = qn('w:gridSpan')
+_W_JC = qn('w:jc')
+_W_R = qn('w:r')
+_W_T = qn('w:t')
+_W_TAB = qn('w:tab')
+_W_BR = qn('w:br')
+_W_RPR = qn('w:rPr')
+_W_PPR = qn('w:pPr')
+_W_B = qn('w:b')
+_W_I = qn('w:i')
+_W_STRIKE = qn('w:strike')
+_W_DELTEXT = qn('w:delText')
+_W_PSTYLE = qn('w:pStyle')
+_W_PAGE_BREAK_BEFORE = qn('w:pageBreakBefore')
+_W_SECTPR = qn('w:sectPr')
+_W_NUMPR = qn('w:numPr')
+_W_ILVL = qn('w:ilvl')
+_W_NUMID = qn('w:numId')
+_W_HYPERLINK = qn('w:hyperlink')
+_W_DRAWING = qn('w:drawing')
+_W_FOOTNOTE_REF = qn('w:footnoteReference')
+_W_ENDNOTE_REF = qn('w:endnoteReference')
+_W_COMMENT_RANGE_START = qn('w:commentRangeStart')
+_W_COMMENT_RANGE_END = qn('w:commentRangeEnd')
+
+# DrawingML tags referenced while scanning paragraph drawings
+_C_CHART = '{http://schemas.openxmlformats.org/drawingml/2006/chart}chart'
+_A_BLIP = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+
+# Qualified attribute names, interned once instead of re-hashing the
+# 80-character literals on every .get()
+_W_VAL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val'
+_W_ID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id'
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+_R_LINK = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}link'
+
+# Header/footer part names, compiled once. Anchored so e.g.
+# 'word/header1.xml.rels' doesn't match.
+_HEADER_RE = re.compile(r'^word/header\d+\.xml$')
+_FOOTER_RE = re.compile(r'^word/footer\d+\.xml$')
+
+# Newline-to-space translation for table cells; pipes still need
+# .replace() since they escape to two characters.
+# Table-cell sanitization in one C-level pass: newlines collapse to
+# spaces and pipes are escaped so they can't break the row syntax
+_TABLE_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '|': '\\|'})
+
+# Markdown separator-row cell per column alignment ('left' falls through)
+_SEPARATOR_MARKS = {'center': ':---:', 'right': '---:'}
+
+# Below this document.xml size the process-pool dispatch of headers,
+# body and footers costs more than it saves; convert serially instead.
+_PARALLEL_MIN_DOC_BYTES = 256 * 1024
 
+# Minimum number of top-level body children before paragraph conversion
+# is dispatched to a thread pool (thread startup isn't free on tiny docs)
+_THREADED_MIN_BODY_CHILDREN = 64
 
-def get_heading_level(pStyle_val, styles_info=None):
+# Fallback heading-style detection: 'heading1' / 'heading 1' / 'h1'
+# exactly, with a substring fallback for derived names like 'Heading1Char'
+_HEADING_STYLE_RE = re.compile(r'^(?:heading\s*([1-6])|h([1-6]))$')
+_HEADING_SUBSTR_RE = re.compile(r'heading\s*([1-6])')
+_TITLE_STYLES = frozenset({'title'})
+
+# Exact-match table for the overwhelmingly common style names; a single
+# dict lookup short-circuits the regex work below
+_HEADING_MAP = {'title': 1}
+for _level in range(1, 7):
+    _HEADING_MAP['heading{}'.format(_level)] = _level
+    _HEADING_MAP['heading {}'.format(_level)] = _level
+    _HEADING_MAP['h{}'.format(_level)] = _level
+del _level
+
+
+# Per-document conversion state, parsed once in convert_to_markdown and
+# passed down the call chain as a single object instead of ten parallel
+# keyword arguments. Immutable, so it's safe to share across the thread
+# pool, and (with zipf stripped) picklable for the process-pool path.
+ConvCtx = namedtuple('ConvCtx', [
+    'numbering_info', 'hyperlinks', 'images', 'img_dir', 'zipf',
+    'footnotes', 'endnotes', 'comments', 'styles_info', 'charts',
+])
+ConvCtx.__new__.__defaults__ = (None,) * len(ConvCtx._fields)
+
+
+def get_heading_level(pStyle_val, styles_info=None, cache=None):
     """
     Maps paragraph style to markdown heading level.
     Uses styles.xml information if available for better custom style detection.
-    
+
     Args:
         pStyle_val: Paragraph style value
         styles_info: Dict mapping style IDs to style information (from styles.xml)
-    
+        cache: Optional per-conversion dict memoizing resolved levels;
+            documents reuse a handful of styles across thousands of
+            paragraphs, so hits are nearly free
+
     Returns:
         int: Heading level (1-6) or None if not a heading
     """
     if not pStyle_val:
         return None
-    
+
+    if cache is not None and pStyle_val in cache:
+        return cache[pStyle_val]
+
+    level = _compute_heading_level(pStyle_val, styles_info, cache)
+    if cache is not None:
+        cache[pStyle_val] = level
+    return level
+
+
+def _compute_heading_level(pStyle_val, styles_info, cache):
+    """
+    Uncached heading-level resolution backing get_heading_level.
+    """
     # First check styles.xml if available
     if styles_info and pStyle_val in styles_info:
         style_info = styles_info[pStyle_val]
-        if style_info.get('is_heading'):
-            level = style_info.get('heading_level')
+        if style_info.is_heading:
+            level = style_info.heading_level
             if level:
                 return level
     
-    # Fallback to pattern matching
+    # Fallback to pattern matching: an exact dict lookup first, then one
+    # anchored regex instead of up to a dozen substring tests per style
     pStyle_lower = pStyle_val.lower()
-    if 'title' in pStyle_lower:
+    level = _HEADING_MAP.get(pStyle_lower)
+    if level:
+        return level
+    if pStyle_lower in _TITLE_STYLES or 'title' in pStyle_lower:
         return 1
-    elif 'heading1' in pStyle_lower or 'heading 1' in pStyle_lower or 'h1' == pStyle_lower:
-        return 1
-    elif 'heading2' in pStyle_lower or 'heading 2' in pStyle_lower or 'h2' == pStyle_lower:
-        return 2
-    elif 'heading3' in pStyle_lower or 'heading 3' in pStyle_lower or 'h3' == pStyle_lower:
-        return 3
-    elif 'heading4' in pStyle_lower or 'heading 4' in pStyle_lower or 'h4' == pStyle_lower:
-        return 4
-    elif 'heading5' in pStyle_lower or 'heading 5' in pStyle_lower or 'h5' == pStyle_lower:
-        return 5
-    elif 'heading6' in pStyle_lower or 'heading 6' in pStyle_lower or 'h6' == pStyle_lower:
-        return 6
-    
+    match = _HEADING_STYLE_RE.match(pStyle_lower)
+    if match:
+        return int(match.group(1) or match.group(2))
+    # Styles like 'Heading1Char' keep the old substring behavior
+    match = _HEADING_SUBSTR_RE.search(pStyle_lower)
+    if match:
+        return int(match.group(1))
+
     # Check if based_on style is a heading (recursive check)
     if styles_info and pStyle_val in styles_info:
-        based_on = styles_info[pStyle_val].get('based_on')
+        based_on = styles_info[pStyle_val].based_on
         if based_on:
-            return get_heading_level(based_on, styles_info)
-    
+            return get_heading_level(based_on, styles_info, cache)
+
     return None
 
 
@@ -80,275 +198,362 @@ def parse_run_to_markdown(r_elem, hyperlinks=None, images=None, img_dir=None, zi
     Returns:
         Markdown string with formatting
     """
-    text = ''
-    rPr = r_elem.find(qn('w:rPr'))
-    
-    # Extract text from runs
-    for t_elem in r_elem.findall(qn('w:t')):
-        if t_elem.text:
-            text += t_elem.text
-    
-    # Handle tabs and breaks
-    for tab in r_elem.findall(qn('w:tab')):
-        text += '    '  # Convert tab to 4 spaces
-    for br in r_elem.findall(qn('w:br')):
-        text += '\n'
-    
-    # Handle footnote references
-    for footnote_ref in r_elem.findall(qn('w:footnoteReference')):
-        footnote_id = footnote_ref.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-        if footnotes and footnote_id in footnotes:
-            text += f'[^{footnote_id}]'
-        else:
-            text += f'[^{footnote_id}]'
-    
-    # Handle endnote references
-    for endnote_ref in r_elem.findall(qn('w:endnoteReference')):
-        endnote_id = endnote_ref.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-        if endnotes and endnote_id in endnotes:
-            text += f'[^{endnote_id}]'
-        else:
-            text += f'[^{endnote_id}]'
-    
+    text, is_bold, is_italic, is_strike = _extract_run(r_elem)
     if not text:
         return ''
-    
-    # Apply formatting (check all formatting first, then apply appropriately)
-    if rPr is not None:
-        is_bold = rPr.find(qn('w:b')) is not None
-        is_italic = rPr.find(qn('w:i')) is not None
-        is_strike = (rPr.find(qn('w:strike')) is not None or 
-                     rPr.find(qn('w:delText')) is not None)
-        
-        # Apply formatting in correct order (strikethrough, then bold/italic)
-        if is_strike:
-            text = '~~' + text + '~~'
-        
-        # Bold and italic together
-        if is_bold and is_italic:
-            text = '***' + text + '***'
-        elif is_bold:
-            text = '**' + text + '**'
-        elif is_italic:
-            text = '*' + text + '*'
-    
+    return _wrap_run_text(text, is_bold, is_italic, is_strike, link_url)
+
+
+def _extract_run(r_elem):
+    """
+    Extracts a run's text content and formatting flags.
+
+    One pass over the run's children replaces six separate findall
+    walks (text, tabs, breaks, note refs, run properties). Content is
+    collected in document order.
+
+    Returns:
+        Tuple of (text, is_bold, is_italic, is_strike)
+    """
+    parts = []
+    rPr = None
+    for child in r_elem:
+        tag = child.tag
+        if tag == _W_T:
+            if child.text:
+                parts.append(child.text)
+        elif tag == _W_TAB:
+            parts.append('    ')  # Convert tab to 4 spaces
+        elif tag == _W_BR:
+            parts.append('\n')
+        elif tag == _W_RPR:
+            rPr = child
+        elif tag == _W_FOOTNOTE_REF or tag == _W_ENDNOTE_REF:
+            parts.append(f'[^{child.get(_W_ID)}]')
+
+    text = ''.join(parts)
+    if not text or rPr is None:
+        # Nothing to format, or no run properties to inspect
+        return text, False, False, False
+
+    is_bold = rPr.find(_W_B) is not None
+    is_italic = rPr.find(_W_I) is not None
+    is_strike = (rPr.find(_W_STRIKE) is not None or
+                 rPr.find(_W_DELTEXT) is not None)
+    return text, is_bold, is_italic, is_strike
+
+
+def _coalesce_runs(runs):
+    """
+    Converts a sequence of runs, merging adjacent runs that share the
+    same formatting into one wrapper. Word splits logically-identical
+    text into many runs (revision tracking, spell check), which would
+    otherwise emit noise like ``**foo****bar**``.
+
+    Returns:
+        Markdown string for the run sequence
+    """
+    out = []
+    pending_fmt = None
+    pending_text = []
+    for r in runs:
+        text, is_bold, is_italic, is_strike = _extract_run(r)
+        if not text:
+            continue
+        fmt = (is_bold, is_italic, is_strike)
+        if fmt == pending_fmt:
+            pending_text.append(text)
+            continue
+        if pending_text:
+            out.append(_wrap_run_text(''.join(pending_text), pending_fmt[0], pending_fmt[1], pending_fmt[2], None))
+        pending_fmt = fmt
+        pending_text = [text]
+    if pending_text:
+        out.append(_wrap_run_text(''.join(pending_text), pending_fmt[0], pending_fmt[1], pending_fmt[2], None))
+    return ''.join(out)
+
+
+@functools.lru_cache(maxsize=4096)
+def _wrap_run_text(text, is_bold, is_italic, is_strike, link_url):
+    """
+    Wraps run text in markdown formatting markers.
+
+    Documents repeat the same short runs (spaces, boilerplate) with the
+    same formatting constantly, so this pure string step is memoized.
+    """
+    # Apply formatting in correct order (strikethrough, then bold/italic)
+    if is_strike:
+        text = '~~' + text + '~~'
+
+    # Bold and italic together
+    if is_bold and is_italic:
+        text = '***' + text + '***'
+    elif is_bold:
+        text = '**' + text + '**'
+    elif is_italic:
+        text = '*' + text + '*'
+
     # Wrap in hyperlink if provided
     if link_url:
         text = '[' + text + '](' + link_url + ')'
-    
+
     return text
 
 
-def parse_paragraph_to_markdown(p_elem, numbering_info=None, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, comments=None, list_counters=None, styles_info=None, charts=None):
+def _render_chart(chart_rel_id, charts):
+    """
+    Renders a referenced chart as a markdown fragment.
+
+    Args:
+        chart_rel_id: Relationship ID of the chart
+        charts: Dict mapping chart relationship IDs to chart information
+
+    Returns:
+        Markdown string (comment marker, caption and optional data block)
+    """
+    if not charts or chart_rel_id not in charts:
+        return '\n\n*[Chart (relationship ID: ' + chart_rel_id + ') - data not available]*\n'
+
+    chart_info = charts[chart_rel_id]
+    chart_title = chart_info.get('title', 'Chart')
+    chart_type = chart_info.get('chart_type', 'Chart')
+    data_points = chart_info.get('data_points', [])
+
+    out = [f'\n\n<!-- Chart: {chart_title}']
+    if chart_type:
+        out.append(f' ({chart_type})')
+    out.append(' -->\n')
+    out.append(f'*[Chart: {chart_title}')
+    if chart_type:
+        out.append(f' ({chart_type})')
+    out.append(']*\n')
+
+    # Add chart data if available
+    if data_points:
+        out.append('\n```\n')
+        out.append('Chart Data:\n')
+        for i, series in enumerate(data_points):
+            series_name = series.get('series_name', f'Series {i+1}')
+            values = series.get('values', [])
+            categories = series.get('categories')
+
+            out.append(f'\n{series_name}:\n')
+            if categories and len(categories) == len(values):
+                # Show as table format; one join per series instead of
+                # formatting each row into the output list individually
+                out.append('\n'.join([f'  {cat}: {val}' for cat, val in zip(categories, values)]))
+                out.append('\n')
+            else:
+                # Just show values
+                out.append('  Values: ' + ', '.join(map(str, values)) + '\n')
+        out.append('```\n')
+    elif chart_info.get('has_data'):
+        out.append('<!-- Chart contains data (embedded Excel reference) -->\n')
+
+    return ''.join(out)
+
+
+def _is_run(child):
+    """groupby key: whether a paragraph child is a text run."""
+    return child.tag == _W_R
+
+
+def _handle_hyperlink_child(child, para_parts, ctx):
+    """Appends markdown for a hyperlink child, wrapping its runs."""
+    rel_id = child.get(_R_ID)
+    link_url = '#'
+    if rel_id and ctx.hyperlinks:
+        link_url = ctx.hyperlinks.get(rel_id, '#')
+
+    link_text = _coalesce_runs(child.findall(_W_R))
+
+    if link_text:
+        para_parts.append('[' + link_text + '](' + link_url + ')')
+
+
+def _handle_comment_end_child(child, para_parts, ctx):
+    """Appends an inline comment marker when the comment range closes."""
+    comments = ctx.comments
+    comment_id = child.get(_W_ID)
+    if comments and comment_id in comments:
+        comment_data = comments[comment_id]
+        para_parts.append(f' <!-- Comment by {comment_data["author"]}: {comment_data["text"][:50]}... -->')
+
+
+# Dispatch table for non-run children of <w:p> (runs are coalesced as
+# groups); commentRangeStart needs no output so it simply has no entry.
+_P_CHILD_HANDLERS = {
+    _W_HYPERLINK: _handle_hyperlink_child,
+    _W_COMMENT_RANGE_END: _handle_comment_end_child,
+}
+
+
+def _parse_paragraph_fast(p_elem, ctx, heading_cache=None):
+    """
+    Stripped-down paragraph conversion for the common document profile:
+    no hyperlink targets, no images, no list numbering, no comments and
+    no charts. Mirrors the full paragraph parser minus the branches
+    those features need; paragraphs containing drawings are handed back
+    to the full parser.
+    """
+    if next(p_elem.iter(_W_DRAWING), None) is not None:
+        return _paragraph_md(p_elem, ctx, None, heading_cache)
+
+    pPr = p_elem.find(_W_PPR)
+
+    prefix = ''
+    if pPr is not None and pPr.find(_W_PAGE_BREAK_BEFORE) is not None:
+        prefix = '<!-- Page Break -->\n\n'
+    elif p_elem.find(_W_SECTPR) is not None:
+        prefix = '<!-- Section Break -->\n\n'
+
+    heading_level = None
+    if pPr is not None:
+        pStyle = pPr.find(_W_PSTYLE)
+        if pStyle is not None:
+            heading_level = get_heading_level(pStyle.get(_W_VAL), ctx.styles_info, heading_cache)
+
+    para_parts = []
+    for is_run, group in groupby(p_elem, _is_run):
+        if is_run:
+            para_parts.append(_coalesce_runs(group))
+        else:
+            # Structural children (anchor-only hyperlinks etc.) still go
+            # through the regular handlers so no text is dropped
+            for child in group:
+                handler = _P_CHILD_HANDLERS.get(child.tag)
+                if handler is not None:
+                    handler(child, para_parts, ctx)
+    para_text = ''.join(para_parts).strip()
+
+    if not para_text:
+        return prefix if prefix else ''
+    if heading_level:
+        return prefix + '#' * heading_level + ' ' + para_text
+    return prefix + para_text
+
+
+def parse_paragraph_to_markdown(p_elem, numbering_info=None, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, comments=None, list_counters=None, styles_info=None, charts=None, heading_cache=None):
     """
     Converts a paragraph (<w:p>) to markdown.
     Handles headings, lists, regular paragraphs, and formatting.
-    
+
     Args:
         p_elem: XML element representing a paragraph
-        numbering_info: Dict mapping numId to list information
+        numbering_info: Dict mapping numId to (list_type, num_format) tuples
         hyperlinks: Dict mapping relationship IDs to URLs
         images: Dict mapping relationship IDs to image paths
         img_dir: Directory for extracted images
         zipf: ZipFile object
-    
+
     Returns:
         Markdown string
     """
-    pPr = p_elem.find(qn('w:pPr'))
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+    return _paragraph_md(p_elem, ctx, list_counters, heading_cache)
+
+
+def _paragraph_md(p_elem, ctx, list_counters=None, heading_cache=None):
+    """
+    Context-threaded backend for parse_paragraph_to_markdown.
+    """
+    numbering_info = ctx.numbering_info
+    pPr = p_elem.find(_W_PPR)
     
     # Check for page break
     has_page_break = False
     if pPr is not None:
-        page_break_before = pPr.find(qn('w:pageBreakBefore'))
+        page_break_before = pPr.find(_W_PAGE_BREAK_BEFORE)
         if page_break_before is not None:
             has_page_break = True
     
     # Check for section break
     has_section_break = False
-    sectPr = p_elem.find(qn('w:sectPr'))
+    sectPr = p_elem.find(_W_SECTPR)
     if sectPr is not None:
         has_section_break = True
     
     # Check for heading
     heading_level = None
     if pPr is not None:
-        pStyle = pPr.find(qn('w:pStyle'))
+        pStyle = pPr.find(_W_PSTYLE)
         if pStyle is not None:
-            style_val = pStyle.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-            heading_level = get_heading_level(style_val, styles_info)
+            style_val = pStyle.get(_W_VAL)
+            heading_level = get_heading_level(style_val, ctx.styles_info, heading_cache)
     
     # Check for list item
     is_list_item = False
-    list_info = None
+    list_ilvl = 0
+    list_type = 'bullet'
+    list_counter = 1
     if pPr is not None:
-        numPr = pPr.find(qn('w:numPr'))
+        numPr = pPr.find(_W_NUMPR)
         if numPr is not None and numbering_info:
-            ilvl_elem = numPr.find(qn('w:ilvl'))
-            numId_elem = numPr.find(qn('w:numId'))
+            ilvl_elem = numPr.find(_W_ILVL)
+            numId_elem = numPr.find(_W_NUMID)
             if ilvl_elem is not None and numId_elem is not None:
-                ilvl = int(ilvl_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', 0))
-                numId = numId_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
+                list_ilvl = int(ilvl_elem.get(_W_VAL, 0))
+                numId = numId_elem.get(_W_VAL)
                 if numId in numbering_info:
                     is_list_item = True
-                    list_info = {
-                        'ilvl': ilvl,
-                        'numId': numId,
-                        'list_type': numbering_info[numId].get('list_type', 'bullet'),
-                        'num_format': numbering_info[numId].get('num_format', 'decimal')
-                    }
-                    
+                    list_type, _num_format = numbering_info[numId]
+
                     # Track list counters for numbered lists
-                    if list_info['list_type'] == 'number' and list_counters is not None:
-                        list_key = f"{numId}_{ilvl}"
+                    if list_type == 'number' and list_counters is not None:
+                        list_key = f"{numId}_{list_ilvl}"
                         if list_key not in list_counters:
                             list_counters[list_key] = 0
                         list_counters[list_key] += 1
-                        list_info['counter'] = list_counters[list_key]
+                        list_counter = list_counters[list_key]
     
     # Extract text from runs
-    para_text = ''
-    
-    # Process all child elements in order (runs and hyperlinks)
-    for child in p_elem:
-        if child.tag == qn('w:r'):
-            # Regular run
-            para_text += parse_run_to_markdown(child, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes)
-        elif child.tag == qn('w:hyperlink'):
-            # Hyperlink - process runs inside it
-            rel_id = child.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
-            link_url = '#'
-            if rel_id and hyperlinks:
-                link_url = hyperlinks.get(rel_id, '#')
-            
-            link_text = ''
-            for r in child.findall(qn('w:r')):
-                link_text += parse_run_to_markdown(r, hyperlinks, images, img_dir, zipf, link_url=None, footnotes=footnotes, endnotes=endnotes)
-            
-            if link_text:
-                para_text += '[' + link_text + '](' + link_url + ')'
-        elif child.tag == qn('w:commentRangeStart'):
-            # Comment start - we'll handle this with commentRangeEnd
-            pass
-        elif child.tag == qn('w:commentRangeEnd'):
-            # Comment end - extract comment
-            comment_id = child.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-            if comments and comment_id in comments:
-                comment_data = comments[comment_id]
-                para_text += f' <!-- Comment by {comment_data["author"]}: {comment_data["text"][:50]}... -->'
-    
-    # Handle images and charts
-    for drawing in p_elem.findall('.//' + qn('w:drawing')):
-        # Check for charts - charts can be in graphicFrame or directly in graphic
-        chart_ref = drawing.find('.//{http://schemas.openxmlformats.org/drawingml/2006/chart}chart')
-        if chart_ref is not None:
-            chart_rel_id = chart_ref.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
+    para_parts = []
+    
+    # Process children in order; consecutive runs are grouped so equal
+    # formatting coalesces into one wrapper, other children go through
+    # the module-level tag dispatch table
+    for is_run, group in groupby(p_elem, _is_run):
+        if is_run:
+            para_parts.append(_coalesce_runs(group))
+        else:
+            for child in group:
+                handler = _P_CHILD_HANDLERS.get(child.tag)
+                if handler is not None:
+                    handler(child, para_parts, ctx)
+    
+    # Handle images and charts in one pass over the paragraph subtree
+    # instead of separate descendant scans for drawings, charts and blips.
+    # Most paragraphs have no drawing at all, so a cheap tag-filtered
+    # probe gates the full walk.
+    has_drawing = next(p_elem.iter(_W_DRAWING), None) is not None
+    in_chart_drawing = False
+    for node in (p_elem.iter() if has_drawing else ()):
+        tag = node.tag
+        if tag == _W_DRAWING:
+            in_chart_drawing = False
+        elif tag == _C_CHART:
+            chart_rel_id = node.get(_R_ID)
             if chart_rel_id:
-                        if charts and chart_rel_id in charts:
-                            chart_info = charts[chart_rel_id]
-                            chart_title = chart_info.get('title', 'Chart')
-                            chart_type = chart_info.get('chart_type', 'Chart')
-                            data_points = chart_info.get('data_points', [])
-                            
-                            para_text += f'\n\n<!-- Chart: {chart_title}'
-                            if chart_type:
-                                para_text += f' ({chart_type})'
-                            para_text += ' -->\n'
-                            para_text += f'*[Chart: {chart_title}'
-                            if chart_type:
-                                para_text += f' ({chart_type})'
-                            para_text += ']*\n'
-                            
-                            # Add chart data if available
-                            if data_points:
-                                para_text += '\n```\n'
-                                para_text += 'Chart Data:\n'
-                                for i, series in enumerate(data_points):
-                                    series_name = series.get('series_name', f'Series {i+1}')
-                                    values = series.get('values', [])
-                                    categories = series.get('categories')
-                                    
-                                    para_text += f'\n{series_name}:\n'
-                                    if categories and len(categories) == len(values):
-                                        # Show as table format
-                                        for cat, val in zip(categories, values):
-                                            para_text += f'  {cat}: {val}\n'
-                                    else:
-                                        # Just show values
-                                        para_text += f'  Values: {", ".join(map(str, values))}\n'
-                                para_text += '```\n'
-                            elif chart_info.get('has_data'):
-                                para_text += '<!-- Chart contains data (embedded Excel reference) -->\n'
-                        else:
-                            para_text += '\n\n*[Chart (relationship ID: ' + chart_rel_id + ') - data not available]*\n'
-                        continue
-        
-        # Check for charts in graphicFrame elements
-        graphic_frame = drawing.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}graphicFrame')
-        if graphic_frame is not None:
-            graphic = graphic_frame.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}graphic')
-            if graphic is not None:
-                chart_ref = graphic.find('.//{http://schemas.openxmlformats.org/drawingml/2006/chart}chart')
-                if chart_ref is not None:
-                    chart_rel_id = chart_ref.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id')
-                    if chart_rel_id:
-                        if charts and chart_rel_id in charts:
-                            chart_info = charts[chart_rel_id]
-                            chart_title = chart_info.get('title', 'Chart')
-                            chart_type = chart_info.get('chart_type', 'Chart')
-                            data_points = chart_info.get('data_points', [])
-                            
-                            para_text += f'\n\n<!-- Chart: {chart_title}'
-                            if chart_type:
-                                para_text += f' ({chart_type})'
-                            para_text += ' -->\n'
-                            para_text += f'*[Chart: {chart_title}'
-                            if chart_type:
-                                para_text += f' ({chart_type})'
-                            para_text += ']*\n'
-                            
-                            # Add chart data if available
-                            if data_points:
-                                para_text += '\n```\n'
-                                para_text += 'Chart Data:\n'
-                                for i, series in enumerate(data_points):
-                                    series_name = series.get('series_name', f'Series {i+1}')
-                                    values = series.get('values', [])
-                                    categories = series.get('categories')
-                                    
-                                    para_text += f'\n{series_name}:\n'
-                                    if categories and len(categories) == len(values):
-                                        # Show as table format
-                                        for cat, val in zip(categories, values):
-                                            para_text += f'  {cat}: {val}\n'
-                                    else:
-                                        # Just show values
-                                        para_text += f'  Values: {", ".join(map(str, values))}\n'
-                                para_text += '```\n'
-                            elif chart_info.get('has_data'):
-                                para_text += '<!-- Chart contains data (embedded Excel reference) -->\n'
-                        else:
-                            para_text += '\n\n*[Chart (relationship ID: ' + chart_rel_id + ') - data not available]*\n'
-                        continue
-        
-        # Try to extract image relationship
-        blip = drawing.find('.//{http://schemas.openxmlformats.org/drawingml/2006/main}blip')
-        if blip is not None:
-            rel_id = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed')
+                para_parts.append(_render_chart(chart_rel_id, ctx.charts))
+                in_chart_drawing = True
+        elif tag == _A_BLIP and not in_chart_drawing:
+            rel_id = node.get(_R_EMBED)
             if not rel_id:
-                rel_id = blip.get('{http://schemas.openxmlformats.org/officeDocument/2006/relationships}link')
-            
-            if rel_id and images:
-                img_path = images.get(rel_id, '')
+                rel_id = node.get(_R_LINK)
+
+            if rel_id and ctx.images:
+                img_path = ctx.images.get(rel_id, '')
+                img_dir = ctx.img_dir
                 if img_dir and img_path:
                     # Use relative path from img_dir
                     img_filename = os.path.basename(img_path)
                     img_md_path = os.path.join(img_dir, img_filename) if img_dir else img_path
-                    para_text += '\n![' + img_filename + '](' + img_md_path + ')\n'
+                    para_parts.append('\n![' + img_filename + '](' + img_md_path + ')\n')
                 elif img_path:
-                    para_text += '\n![' + os.path.basename(img_path) + '](' + img_path + ')\n'
-    
-    para_text = para_text.strip()
+                    para_parts.append('\n![' + os.path.basename(img_path) + '](' + img_path + ')\n')
+
+    para_text = ''.join(para_parts).strip()
     
     # Add page/section break markers
     prefix = ''
@@ -364,18 +569,17 @@ def parse_paragraph_to_markdown(p_elem, numbering_info=None, hyperlinks=None, im
     if heading_level:
         return prefix + '#' * heading_level + ' ' + para_text
     elif is_list_item:
-        indent = '  ' * list_info['ilvl']
-        if list_info['list_type'] == 'bullet':
+        indent = '  ' * list_ilvl
+        if list_type == 'bullet':
             return prefix + indent + '- ' + para_text
         else:
             # Use tracked counter for numbered lists
-            counter = list_info.get('counter', 1)
-            return prefix + indent + f'{counter}. ' + para_text
+            return prefix + indent + f'{list_counter}. ' + para_text
     else:
         return prefix + para_text
 
 
-def parse_table_to_markdown(tbl_elem, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, styles_info=None):
+def parse_table_to_markdown(tbl_elem, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, styles_info=None, heading_cache=None):
     """
     Converts a table (<w:tbl>) to markdown table syntax.
     
@@ -389,35 +593,53 @@ def parse_table_to_markdown(tbl_elem, hyperlinks=None, images=None, img_dir=None
     Returns:
         Markdown table string
     """
-    rows = tbl_elem.findall(qn('w:tr'))
+    ctx = ConvCtx(None, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, None, styles_info, None)
+    return _table_md(tbl_elem, ctx, heading_cache)
+
+
+def _table_md(tbl_elem, ctx, heading_cache=None):
+    """
+    Context-threaded backend for parse_table_to_markdown.
+    """
+    rows = tbl_elem.findall(_W_TR)
     if not rows:
         return ''
-    
+
+    # Cell paragraphs never take part in list numbering, and comments
+    # and charts are not rendered inside cells (an inline marker or a
+    # fenced chart block would be flattened by the cell sanitization and
+    # break the row syntax), so strip all three from the cell context
+    if ctx.numbering_info or ctx.comments or ctx.charts:
+        cell_ctx = ctx._replace(numbering_info=None, comments=None, charts=None)
+    else:
+        cell_ctx = ctx
+
     markdown_rows = []
     num_cols = 0
     
     # First pass: determine number of columns and extract all rows
     col_alignments = []  # Track column alignments
     for row_idx, row in enumerate(rows):
-        cells = row.findall(qn('w:tc'))
+        cells = row.findall(_W_TC)
         row_data = []
         row_alignments = []
         
         for cell in cells:
             # Check for gridSpan (merged cells)
-            tcPr = cell.find(qn('w:tcPr'))
+            tcPr = cell.find(_W_TCPR)
             grid_span = 1
             cell_alignment = 'left'  # Default alignment
             
             if tcPr is not None:
-                gridSpan_elem = tcPr.find(qn('w:gridSpan'))
+                gridSpan_elem = tcPr.find(_W_GRIDSPAN)
                 if gridSpan_elem is not None:
-                    grid_span = int(gridSpan_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', 1))
+                    grid_span = int(gridSpan_elem.get(_W_VAL, 1))
                 
                 # Check for cell alignment
-                jc_elem = tcPr.find(qn('w:jc'))
+                jc_elem = tcPr.find(_W_JC)
                 if jc_elem is not None:
-                    jc_val = jc_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val', 'left')
+                    jc_val = jc_elem.get(_W_VAL, 'left')
                     if jc_val == 'center':
                         cell_alignment = 'center'
                     elif jc_val == 'right':
@@ -427,12 +649,12 @@ def parse_table_to_markdown(tbl_elem, hyperlinks=None, images=None, img_dir=None
             
             # Extract cell text
             cell_text = ''
-            for p in cell.findall(qn('w:p')):
-                p_text = parse_paragraph_to_markdown(p, None, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, styles_info=styles_info)
+            for p in cell.findall(_W_P):
+                p_text = _paragraph_md(p, cell_ctx, None, heading_cache)
                 if p_text:
                     cell_text += p_text + ' '
             
-            cell_text = cell_text.strip().replace('\n', ' ').replace('|', '\\|')
+            cell_text = cell_text.strip().translate(_TABLE_TRANS)
             
             # Add merged cells
             row_data.append(cell_text)
@@ -457,28 +679,22 @@ def parse_table_to_markdown(tbl_elem, hyperlinks=None, images=None, img_dir=None
     if not markdown_rows:
         return ''
     
-    # Normalize column count
+    # Normalize column count (single C-level extend per short row)
     for row in markdown_rows:
-        while len(row) < num_cols:
-            row.append('')
-    
+        if len(row) < num_cols:
+            row.extend([''] * (num_cols - len(row)))
+    if len(col_alignments) < num_cols:
+        col_alignments.extend(['left'] * (num_cols - len(col_alignments)))
+
     # Build markdown table with alignment hints
     md_table = []
-    
+
     # Header row (assume first row is header, or detect via style)
     header_row = markdown_rows[0]
     md_table.append('| ' + ' | '.join(header_row) + ' |')
-    
+
     # Separator row with alignment hints
-    separator_parts = []
-    for i in range(num_cols):
-        align = col_alignments[i] if i < len(col_alignments) else 'left'
-        if align == 'center':
-            separator_parts.append(':---:')
-        elif align == 'right':
-            separator_parts.append('---:')
-        else:
-            separator_parts.append('---')
+    separator_parts = [_SEPARATOR_MARKS.get(align, '---') for align in col_alignments[:num_cols]]
     md_table.append('| ' + ' | '.join(separator_parts) + ' |')
     
     # Data rows
@@ -499,7 +715,7 @@ def parse_body_to_markdown(root, numbering_info=None, hyperlinks=None, images=No
     
     Args:
         root: XML root element
-        numbering_info: Dict mapping numId to list information
+        numbering_info: Dict mapping numId to (list_type, num_format) tuples
         hyperlinks: Dict mapping relationship IDs to URLs
         images: Dict mapping relationship IDs to image paths
         img_dir: Directory for extracted images
@@ -508,57 +724,264 @@ def parse_body_to_markdown(root, numbering_info=None, hyperlinks=None, images=No
     Returns:
         Markdown string
     """
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+    return _parse_body_md(root, ctx)
+
+
+def _parse_body_md(root, ctx):
+    """
+    Context-threaded backend for parse_body_to_markdown.
+    """
+    # Paragraphs without list numbering are independent of each other, so
+    # large bodies can be converted across threads (lxml releases the GIL
+    # during its C-level traversal). Numbered lists carry order-dependent
+    # counters and must stay on the serial path.
+    if _HAVE_LXML and not ctx.numbering_info:
+        body = root.find(_W_BODY)
+        if body is not None and len(body) > _THREADED_MIN_BODY_CHILDREN:
+            return _parse_body_threaded(body, ctx)
+
+    return '\n\n'.join(_iter_body_md(root, ctx))
+
+
+def _parse_body_threaded(body, ctx):
+    """
+    Converts the direct children of a body across a thread pool and
+    reassembles the markdown chunks in document order.
+    """
+    heading_cache = {}
+
+    def _convert_one(elem):
+        if elem.tag == _W_P:
+            para_md = _paragraph_md(elem, ctx, None, heading_cache)
+            return (para_md,) if para_md else ()
+        if elem.tag == _W_TBL:
+            table_md = _table_md(elem, ctx, heading_cache)
+            return (table_md, '') if table_md else ()
+        return ()
+
     markdown_parts = []
-    body = root.find(qn('w:body'))
-    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for chunk in executor.map(_convert_one, list(body)):
+            markdown_parts.extend(chunk)
+    return '\n\n'.join(markdown_parts)
+
+
+def iter_body_markdown(root, numbering_info=None, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, comments=None, styles_info=None, charts=None):
+    """
+    Generator backing parse_body_to_markdown: yields one markdown chunk
+    per top-level body element, so callers can feed chunks straight into
+    a join or an output stream without an intermediate list.
+
+    Args:
+        (as for parse_body_to_markdown)
+
+    Yields:
+        Markdown string chunks
+    """
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+    return _iter_body_md(root, ctx)
+
+
+def _iter_body_md(root, ctx):
+    """
+    Context-threaded backend for iter_body_markdown.
+    """
+    body = root.find(_W_BODY)
+
     if body is None:
-        return ''
-    
+        return
+
     # Initialize list counters for tracking numbered list sequences
+    # and the per-conversion heading-style cache
     list_counters = {}
-    
+    heading_cache = {}
+
+    # Plain-prose documents take the specialized paragraph parser
+    fast = not (ctx.hyperlinks or ctx.images or ctx.numbering_info or ctx.comments or ctx.charts)
+
     for elem in body:
-        if elem.tag == qn('w:p'):
+        if elem.tag == _W_P:
             # Paragraph
-            para_md = parse_paragraph_to_markdown(elem, numbering_info, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, comments=comments, list_counters=list_counters, styles_info=styles_info, charts=charts)
+            if fast:
+                para_md = _parse_paragraph_fast(elem, ctx, heading_cache)
+            else:
+                para_md = _paragraph_md(elem, ctx, list_counters, heading_cache)
             if para_md:
-                markdown_parts.append(para_md)
-        elif elem.tag == qn('w:tbl'):
+                yield para_md
+        elif elem.tag == _W_TBL:
             # Table
-            table_md = parse_table_to_markdown(elem, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, styles_info=styles_info)
+            table_md = _table_md(elem, ctx, heading_cache)
             if table_md:
-                markdown_parts.append(table_md)
-                markdown_parts.append('')  # Add blank line after table
-    
-    # Append footnotes and endnotes at the end
+                yield table_md
+                yield ''  # Add blank line after table
+
+
+def _append_note_definitions(markdown_parts, footnotes, endnotes):
+    """
+    Appends footnote/endnote definition lines to the collected markdown parts.
+
+    Args:
+        markdown_parts: List of markdown fragments (mutated in place)
+        footnotes: Dict mapping footnote ID to footnote text
+        endnotes: Dict mapping endnote ID to endnote text
+    """
     footnote_parts = []
     if footnotes:
         for footnote_id, footnote_text in sorted(footnotes.items(), key=lambda x: int(x[0]) if x[0].isdigit() else 0):
             footnote_parts.append(f'[^{footnote_id}]: {footnote_text}')
-    
+
     if endnotes:
         for endnote_id, endnote_text in sorted(endnotes.items(), key=lambda x: int(x[0]) if x[0].isdigit() else 0):
             footnote_parts.append(f'[^{endnote_id}]: {endnote_text}')
-    
+
     if footnote_parts:
         markdown_parts.append('')  # Blank line before footnotes
         markdown_parts.extend(footnote_parts)
-    
-    return '\n\n'.join(markdown_parts)
 
 
-def convert_to_markdown(zipf, filelist, img_dir=None):
+def _release_element(elem):
+    """
+    Frees a fully-processed element during incremental parsing.
+    With lxml, also drops already-processed siblings off the root so the
+    partial tree doesn't grow with the document.
+    """
+    elem.clear()
+    if hasattr(elem, 'getprevious'):
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def stream_body_to_markdown(stream, numbering_info=None, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, comments=None, styles_info=None, charts=None):
+    """
+    Streaming variant of parse_body_to_markdown for the main document.
+
+    Uses iterparse so only one top-level paragraph or table is resident
+    at a time instead of materializing the whole document tree. Elements
+    are cleared as soon as they have been converted, which keeps peak
+    memory bounded on large documents.
+
+    Args:
+        stream: File-like object yielding document.xml bytes
+        (remaining arguments as for parse_body_to_markdown)
+
+    Returns:
+        Markdown string
+    """
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+    return '\n\n'.join(_iter_stream_md(stream, ctx))
+
+
+def iter_stream_body_markdown(stream, numbering_info=None, hyperlinks=None, images=None, img_dir=None, zipf=None, footnotes=None, endnotes=None, comments=None, styles_info=None, charts=None):
+    """
+    Generator backing stream_body_to_markdown: yields one markdown chunk
+    per converted top-level element, so callers can forward chunks to an
+    output stream without holding the whole body in memory.
+
+    Args:
+        (as for stream_body_to_markdown)
+
+    Yields:
+        Markdown string chunks
+    """
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+    return _iter_stream_md(stream, ctx)
+
+
+def _iter_stream_md(stream, ctx):
+    """
+    Context-threaded backend for iter_stream_body_markdown.
+    """
+    list_counters = {}
+    heading_cache = {}
+
+    # Plain-prose documents take the specialized paragraph parser
+    fast = not (ctx.hyperlinks or ctx.images or ctx.numbering_info or ctx.comments or ctx.charts)
+
+    # Track depth so we only convert direct children of <w:body>
+    # (w:document -> w:body -> w:p/w:tbl is depth 3); paragraphs nested
+    # inside table cells are handled by the table parser.
+    depth = 0
+    for event, elem in _iterparse(stream, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            continue
+        if depth == 3:
+            if elem.tag == _W_P:
+                if fast:
+                    para_md = _parse_paragraph_fast(elem, ctx, heading_cache)
+                else:
+                    para_md = _paragraph_md(elem, ctx, list_counters, heading_cache)
+                if para_md:
+                    yield para_md
+                _release_element(elem)
+            elif elem.tag == _W_TBL:
+                table_md = _table_md(elem, ctx, heading_cache)
+                if table_md:
+                    yield table_md
+                    yield ''  # Add blank line after table
+                _release_element(elem)
+        depth -= 1
+
+
+def _write_markdown_parts(out, parts):
+    """
+    Streams markdown chunks to a text stream, producing exactly what
+    ``'\\n\\n'.join(parts).strip()`` would, without materializing it.
+
+    Leading whitespace-only chunks are dropped and trailing whitespace
+    is deferred so it can be discarded at the end.
+    """
+    started = False
+    deferred = ''
+    for part in parts:
+        chunk = '\n\n' + part if started else part.lstrip()
+        if not chunk:
+            continue
+        stripped = chunk.rstrip()
+        if stripped:
+            out.write(deferred)
+            out.write(stripped)
+            deferred = chunk[len(stripped):]
+            started = True
+        elif started:
+            deferred += chunk
+
+
+def _convert_xml_bytes(xml_bytes, ctx):
+    """
+    Worker for parallel sub-document conversion: parses one XML payload
+    and returns its markdown. The context must be picklable, so the
+    caller strips the ZipFile handle (the body parsers never read
+    from it).
+    """
+    root = _fromstring(xml_bytes)
+    return _parse_body_md(root, ctx)
+
+
+def convert_to_markdown(zipf, filelist, img_dir=None, out=None, infos=None):
     """
     Converts DOCX file to markdown format.
-    
+
     Args:
         zipf: ZipFile object of the DOCX file
         filelist: List of files in the ZIP archive
         img_dir: Optional directory to extract images
-    
+        out: Optional text stream; when given, markdown is written to it
+            (avoiding a second full copy of the output) and '' is returned
+        infos: Optional dict mapping archive names to ZipInfo objects;
+            reading via ZipInfo skips the per-read name lookup
+
     Returns:
-        Markdown string
+        Markdown string, or '' when writing to ``out``
     """
+    if infos is None:
+        infos = infos_by_name(zipf)
+
     markdown_parts = []
     
     # Parse relationships
@@ -572,6 +995,13 @@ def convert_to_markdown(zipf, filelist, img_dir=None):
         numbering_info = parse_numbering_xml(zipf)
     except Exception:
         numbering_info = {}
+
+    # Flatten to plain (list_type, num_format) tuples so the per-paragraph
+    # list checks are a single dict hit with no .get dispatch
+    numbering_info = {
+        num_id: (info.get('list_type', 'bullet'), info.get('num_format', 'decimal'))
+        for num_id, info in numbering_info.items()
+    }
     
     # Parse footnotes and endnotes
     try:
@@ -609,43 +1039,103 @@ def convert_to_markdown(zipf, filelist, img_dir=None):
         except Exception:
             pass  # Continue even if image extraction fails
     
-    # Process headers
-    header_xmls = 'word/header[0-9]*.xml'
+    # Bundle the parsed per-document state once; every sub-part below is
+    # converted against this same context
+    ctx = ConvCtx(numbering_info, hyperlinks, images, img_dir, zipf,
+                  footnotes, endnotes, comments, styles_info, charts)
+
+    # Collect header/footer part names in a single pass over the archive,
+    # sorted so multi-part documents convert in a deterministic order
+    header_files = []
+    footer_files = []
     for fname in filelist:
-        if re.match(header_xmls, fname):
+        if _HEADER_RE.match(fname):
+            header_files.append(fname)
+        elif _FOOTER_RE.match(fname):
+            footer_files.append(fname)
+    header_files.sort()
+    footer_files.sort()
+
+    doc_info = infos.get('word/document.xml')
+
+    # For large documents with separate header/footer parts, convert the
+    # independent XML trees in parallel worker processes. Small files go
+    # through the serial (streaming) path below.
+    doc_size = doc_info.file_size if doc_info is not None else 0
+
+    if doc_size >= _PARALLEL_MIN_DOC_BYTES and (header_files or footer_files):
+        try:
+            # Decompress the needed members concurrently before handing
+            # the XML payloads to the worker processes
+            member_names = header_files + ['word/document.xml'] + footer_files
+            member_data = read_members_parallel(zipf, member_names)
+            payloads = [member_data[name] for name in member_names]
+
+            worker_ctx = ctx._replace(zipf=None)
+            with ProcessPoolExecutor() as executor:
+                futures = [
+                    executor.submit(_convert_xml_bytes, data, worker_ctx)
+                    for data in payloads
+                ]
+                for future in futures:
+                    part_md = future.result()
+                    if part_md:
+                        markdown_parts.append(part_md)
+
+            _append_note_definitions(markdown_parts, footnotes, endnotes)
+
+            result = '\n\n'.join(markdown_parts).strip()
+            if out is not None:
+                out.write(result)
+                return ''
+            return result
+        except Exception:
+            markdown_parts = []  # Fall back to serial conversion
+
+    def _serial_parts():
+        """Yields every markdown part of the document in order."""
+        # Process headers
+        for fname in header_files:
             try:
-                header_xml = zipf.read(fname)
-                header_root = ET.fromstring(header_xml)
-                header_md = parse_body_to_markdown(header_root, numbering_info, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, comments=comments, styles_info=styles_info, charts=charts)
+                header_xml = zipf.read(infos[fname])
+                header_root = _fromstring(header_xml)
+                header_md = _parse_body_md(header_root, ctx)
                 if header_md:
-                    markdown_parts.append(header_md)
+                    yield header_md
             except Exception:
                 pass  # Skip if header parsing fails
-    
-    # Process main document
-    try:
-        doc_xml = 'word/document.xml'
-        doc_xml_content = zipf.read(doc_xml)
-        doc_root = ET.fromstring(doc_xml_content)
-        doc_md = parse_body_to_markdown(doc_root, numbering_info, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, comments=comments, styles_info=styles_info, charts=charts)
-        if doc_md:
-            markdown_parts.append(doc_md)
-    except Exception as e:
-        # If main document fails, try to extract at least basic text
-        markdown_parts.append(f'<!-- Error parsing document: {str(e)} -->')
-    
-    # Process footers
-    footer_xmls = 'word/footer[0-9]*.xml'
-    for fname in filelist:
-        if re.match(footer_xmls, fname):
+
+        # Process main document (streamed, so large files aren't fully
+        # materialized as an element tree nor as one output string)
+        try:
+            with zipf.open(doc_info if doc_info is not None else 'word/document.xml') as doc_stream:
+                for chunk in _iter_stream_md(doc_stream, ctx):
+                    yield chunk
+        except Exception as e:
+            # If main document fails, try to extract at least basic text
+            yield f'<!-- Error parsing document: {str(e)} -->'
+
+        # Process footers
+        for fname in footer_files:
             try:
-                footer_xml = zipf.read(fname)
-                footer_root = ET.fromstring(footer_xml)
-                footer_md = parse_body_to_markdown(footer_root, numbering_info, hyperlinks, images, img_dir, zipf, footnotes=footnotes, endnotes=endnotes, comments=comments, styles_info=styles_info, charts=charts)
+                footer_xml = zipf.read(infos[fname])
+                footer_root = _fromstring(footer_xml)
+                footer_md = _parse_body_md(footer_root, ctx)
                 if footer_md:
-                    markdown_parts.append(footer_md)
+                    yield footer_md
             except Exception:
                 pass  # Skip if footer parsing fails
-    
-    result = '\n\n'.join(markdown_parts)
-    return result.strip()
+
+        # Footnote/endnote definitions are emitted once for the whole
+        # document (not per sub-part), after all parts are collected
+        note_parts = []
+        _append_note_definitions(note_parts, footnotes, endnotes)
+        for note_md in note_parts:
+            yield note_md
+
+    if out is not None:
+        # Forward chunks to the stream as they're produced instead of
+        # building the full document string first
+        _write_markdown_parts(out, _serial_parts())
+        return ''
+    return '\n\n'.join(_serial_parts()).strip()
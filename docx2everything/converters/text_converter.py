@@ -2,73 +2,140 @@
 Plain text converter for DOCX files.
 """
 
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import qn
+import re
+from io import BytesIO
+
+from ..utils.xml_utils import qn, iterparse
+from ..utils.file_utils import infos_by_name, read_members_parallel
+
+# Header/footer part names, compiled once per process
+_HEADER_RE = re.compile(r'word/header\d*\.xml$')
+_FOOTER_RE = re.compile(r'word/footer\d*\.xml$')
+
+# Precomputed Clark-notation tag names for the per-node hot loops
+_W_T = qn('w:t')
+_W_TAB = qn('w:tab')
+_W_BR = qn('w:br')
+_W_CR = qn('w:cr')
+_W_P = qn('w:p')
+
+# Per-tag emission dispatch; a single dict lookup per node replaces the
+# if/elif ladder of tag comparisons
+_XML2TEXT = {
+    _W_T: lambda elem: elem.text or '',
+    _W_TAB: lambda elem: '\t',
+    _W_BR: lambda elem: '\n',
+    _W_CR: lambda elem: '\n',
+}
 
 
 def xml2text(xml):
     """
     Converts XML content to plain text.
-    
+
     A string representing the textual content of XML, with content
     child elements like ``<w:tab/>`` translated to their Python
     equivalent.
-    
+
     Args:
         xml: XML content as bytes or string
-    
+
+    Returns:
+        Plain text string
+    """
+    if isinstance(xml, str):
+        xml = xml.encode('utf-8')
+    return stream_xml2text(BytesIO(xml))
+
+
+def stream_xml2text(stream):
+    """
+    Streaming backend for xml2text.
+
+    Parses the XML incrementally with iterparse and releases each
+    paragraph once its text has been emitted, so peak memory stays
+    proportional to one paragraph instead of the whole document.
+
+    Args:
+        stream: Binary file-like object yielding the XML content
+
     Returns:
         Plain text string
     """
-    text = ''
-    root = ET.fromstring(xml)
-    for child in root.iter():
-        if child.tag == qn('w:t'):
-            t_text = child.text
-            text += t_text if t_text is not None else ''
-        elif child.tag == qn('w:tab'):
-            text += '\t'
-        elif child.tag in (qn('w:br'), qn('w:cr')):
-            text += '\n'
-        elif child.tag == qn("w:p"):
-            text += '\n\n'
-    return text
-
-
-def convert_to_text(zipf, filelist, img_dir=None):
+    parts = []
+    # With lxml the parser only reports the five tags we emit for,
+    # skipping the styling elements that dominate the node count
+    tags = (_W_T, _W_TAB, _W_BR, _W_CR, _W_P)
+    for event, elem in iterparse(stream, ('start', 'end'), tag=tags):
+        if event == 'start':
+            if elem.tag == _W_P:
+                parts.append('\n\n')
+            continue
+        emit = _XML2TEXT.get(elem.tag)
+        if emit is not None:
+            parts.append(emit(elem))
+        elif elem.tag == _W_P:
+            # Fully emitted; free the subtree (and, with lxml, the
+            # already-processed siblings hanging off the root)
+            elem.clear()
+            if hasattr(elem, 'getprevious'):
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    return ''.join(parts)
+
+
+def convert_to_text(zipf, filelist, img_dir=None, infos=None):
     """
     Converts DOCX file to plain text.
-    
+
     Args:
         zipf: ZipFile object of the DOCX file
         filelist: List of files in the ZIP archive
         img_dir: Optional directory to extract images
-    
+        infos: Optional dict mapping archive names to ZipInfo objects;
+            reading via ZipInfo skips the per-read name lookup
+
     Returns:
         Plain text string
     """
-    text = ''
-    
-    # Get header text
-    header_xmls = 'word/header[0-9]*.xml'
-    import re
+    if infos is None:
+        infos = infos_by_name(zipf)
+
+    parts = []
+
+    # Collect header and footer parts in a single pass over the manifest,
+    # sorted so multi-part documents convert in a deterministic order
+    header_files = []
+    footer_files = []
     for fname in filelist:
-        if re.match(header_xmls, fname):
-            text += xml2text(zipf.read(fname))
-    
-    # Get main text
-    doc_xml = 'word/document.xml'
-    text += xml2text(zipf.read(doc_xml))
-    
+        if _HEADER_RE.match(fname):
+            header_files.append(fname)
+        elif _FOOTER_RE.match(fname):
+            footer_files.append(fname)
+    header_files.sort()
+    footer_files.sort()
+
+    # Decompress the independent header/footer parts concurrently; the
+    # main document is streamed separately below
+    part_files = header_files + footer_files
+    part_data = read_members_parallel(zipf, part_files) if len(part_files) > 1 else None
+
+    # Get header text
+    for fname in header_files:
+        parts.append(xml2text(part_data[fname] if part_data else zipf.read(infos[fname])))
+
+    # Get main text, streamed so the document tree is never fully built
+    doc_info = infos.get('word/document.xml', 'word/document.xml')
+    with zipf.open(doc_info) as f:
+        parts.append(stream_xml2text(f))
+
     # Get footer text
-    footer_xmls = 'word/footer[0-9]*.xml'
-    for fname in filelist:
-        if re.match(footer_xmls, fname):
-            text += xml2text(zipf.read(fname))
-    
+    for fname in footer_files:
+        parts.append(xml2text(part_data[fname] if part_data else zipf.read(infos[fname])))
+
     # Extract images if needed
     if img_dir is not None:
         from ..utils.file_utils import extract_images
         extract_images(zipf, filelist, img_dir)
-    
-    return text.strip()
+
+    return ''.join(parts).strip()
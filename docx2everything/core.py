@@ -5,6 +5,7 @@ Core processing functions for docx2everything.
 import zipfile
 from .converters.text_converter import convert_to_text
 from .converters.markdown_converter import convert_to_markdown
+from .utils.file_utils import infos_by_name
 
 
 def process(docx, img_dir=None):
@@ -18,31 +19,33 @@ def process(docx, img_dir=None):
     Returns:
         Plain text string
     """
-    zipf = zipfile.ZipFile(docx)
-    filelist = zipf.namelist()
-    
-    text = convert_to_text(zipf, filelist, img_dir)
-    
-    zipf.close()
-    return text
+    # The with-statement guarantees the archive is closed on errors; the
+    # central directory is read once and its ZipInfo objects are reused
+    # by the converter instead of re-resolving entry names on every read
+    with zipfile.ZipFile(docx) as zipf:
+        infos = infos_by_name(zipf)
+        filelist = list(infos)
+        return convert_to_text(zipf, filelist, img_dir, infos=infos)
 
 
-def process_to_markdown(docx, img_dir=None):
+def process_to_markdown(docx, img_dir=None, out=None):
     """
     Convert a DOCX file to markdown format, preserving structure like tables,
     lists, headings, formatting, links, and images.
-    
+
     Args:
         docx: Path to the DOCX file
         img_dir: Optional directory to extract images
-    
+        out: Optional text stream to write the markdown to instead of
+            returning it, which avoids holding a second copy in memory
+
     Returns:
-        Markdown string
+        Markdown string ('' when writing to ``out``)
     """
-    zipf = zipfile.ZipFile(docx)
-    filelist = zipf.namelist()
-    
-    markdown = convert_to_markdown(zipf, filelist, img_dir)
-    
-    zipf.close()
-    return markdown
+    # The with-statement guarantees the archive is closed on errors; the
+    # central directory is read once and its ZipInfo objects are reused
+    # by the converter instead of re-resolving entry names on every read
+    with zipfile.ZipFile(docx) as zipf:
+        infos = infos_by_name(zipf)
+        filelist = list(infos)
+        return convert_to_markdown(zipf, filelist, img_dir, out=out, infos=infos)
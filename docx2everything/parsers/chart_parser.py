@@ -2,8 +2,68 @@
 Parser for DOCX chart files to extract chart data and metadata.
 """
 
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import NSMAP
+from ..utils.xml_utils import NSMAP, fromstring, ET, HAVE_LXML
+
+# Chart (DrawingML) namespace and precomputed descendant search paths,
+# built once instead of concatenated on every find/findall call
+_CHART_NS = 'http://schemas.openxmlformats.org/drawingml/2006/chart'
+_ANY_TITLE = './/{' + _CHART_NS + '}title'
+_ANY_TX = './/{' + _CHART_NS + '}tx'
+_ANY_V = './/{' + _CHART_NS + '}v'
+_ANY_STRCACHE = './/{' + _CHART_NS + '}strCache'
+_ANY_PT = './/{' + _CHART_NS + '}pt'
+_ANY_PLOTAREA = './/{' + _CHART_NS + '}plotArea'
+_ANY_SER = './/{' + _CHART_NS + '}ser'
+_ANY_CAT = './/{' + _CHART_NS + '}cat'
+_ANY_VAL = './/{' + _CHART_NS + '}val'
+_ANY_NUMCACHE = './/{' + _CHART_NS + '}numCache'
+_ANY_NUMLIT = './/{' + _CHART_NS + '}numLit'
+
+# Chart-type detection: Clark tag name -> human-readable name, resolved
+# with a single subtree walk instead of one findall per type
+_CHART_TYPE_MAP = {
+    '{' + _CHART_NS + '}barChart': 'Bar Chart',
+    '{' + _CHART_NS + '}lineChart': 'Line Chart',
+    '{' + _CHART_NS + '}pieChart': 'Pie Chart',
+    '{' + _CHART_NS + '}areaChart': 'Area Chart',
+    '{' + _CHART_NS + '}scatterChart': 'Scatter Chart',
+    '{' + _CHART_NS + '}bubbleChart': 'Bubble Chart',
+    '{' + _CHART_NS + '}doughnutChart': 'Doughnut Chart',
+    '{' + _CHART_NS + '}radarChart': 'Radar Chart',
+    '{' + _CHART_NS + '}surfaceChart': 'Surface Chart',
+}
+_C_V = '{' + _CHART_NS + '}v'
+
+# Package-relationship constants used when locating chart parts
+_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_ANY_RELATIONSHIP = './/{' + _REL_NS + '}Relationship'
+_CHART_REL_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart'
+
+
+if HAVE_LXML:
+    # Compile the hot repeated searches once; lxml executes compiled
+    # XPath in C, far faster than re-evaluating the path per call
+    _find_series = ET.XPath('.//c:ser', namespaces={'c': _CHART_NS})
+    _find_points = ET.XPath('.//c:pt', namespaces={'c': _CHART_NS})
+else:
+    def _find_series(elem):
+        return elem.findall(_ANY_SER)
+
+    def _find_points(elem):
+        return elem.findall(_ANY_PT)
+
+
+def _first_v_text(elem):
+    """
+    Returns the first non-empty ``c:v`` text under an element.
+
+    A single descendant walk covers both the direct ``c:v`` layout and
+    the ``strCache -> pt -> v`` layout without separate searches.
+    """
+    for v_elem in elem.iter(_C_V):
+        if v_elem.text:
+            return v_elem.text
+    return None
 
 
 def parse_chart_xml(zipf, chart_path):
@@ -26,95 +86,55 @@ def parse_chart_xml(zipf, chart_path):
     
     try:
         chart_xml = zipf.read(chart_path)
-        root = ET.fromstring(chart_xml)
-        
-        # Chart namespace
-        chart_ns = 'http://schemas.openxmlformats.org/drawingml/2006/chart'
-        
+        root = fromstring(chart_xml)
+
         # Get chart title
-        title_elem = root.find('.//{' + chart_ns + '}title')
+        title_elem = root.find(_ANY_TITLE)
         if title_elem is not None:
-            tx_elem = title_elem.find('.//{' + chart_ns + '}tx')
+            tx_elem = title_elem.find(_ANY_TX)
             if tx_elem is not None:
-                # Try direct v element first
-                v_elem = tx_elem.find('.//{' + chart_ns + '}v')
-                if v_elem is not None and v_elem.text:
-                    chart_info['title'] = v_elem.text
-                else:
-                    # Try strCache -> pt -> v structure
-                    str_cache = tx_elem.find('.//{' + chart_ns + '}strCache')
-                    if str_cache is not None:
-                        pt_elems = str_cache.findall('.//{' + chart_ns + '}pt')
-                        if pt_elems:
-                            # Get first pt element's v text
-                            v_elem = pt_elems[0].find('.//{' + chart_ns + '}v')
-                            if v_elem is not None and v_elem.text:
-                                chart_info['title'] = v_elem.text
-        
-        # Get chart type
-        plot_area = root.find('.//{' + chart_ns + '}plotArea')
+                chart_info['title'] = _first_v_text(tx_elem)
+
+        # Get chart type: first recognized chart element in document order
+        plot_area = root.find(_ANY_PLOTAREA)
         if plot_area is not None:
-            # Check for different chart types
-            chart_types = [
-                ('barChart', 'Bar Chart'),
-                ('lineChart', 'Line Chart'),
-                ('pieChart', 'Pie Chart'),
-                ('areaChart', 'Area Chart'),
-                ('scatterChart', 'Scatter Chart'),
-                ('bubbleChart', 'Bubble Chart'),
-                ('doughnutChart', 'Doughnut Chart'),
-                ('radarChart', 'Radar Chart'),
-                ('surfaceChart', 'Surface Chart'),
-            ]
-            
-            for chart_tag, chart_name in chart_types:
-                if plot_area.find('.//{' + chart_ns + '}' + chart_tag) is not None:
+            for elem in plot_area.iter():
+                chart_name = _CHART_TYPE_MAP.get(elem.tag)
+                if chart_name:
                     chart_info['chart_type'] = chart_name
                     break
         
         # Try to extract data series
         # This is complex and varies by chart type, so we'll do a basic extraction
-        for series in root.findall('.//{' + chart_ns + '}ser'):
+        for series in _find_series(root):
             series_name = None
             values = []
             categories = []
             
-            # Get series name - try multiple structures
-            tx_elem = series.find('.//{' + chart_ns + '}tx')
+            # Get series name - one walk covers all known structures
+            tx_elem = series.find(_ANY_TX)
             if tx_elem is not None:
-                # Try direct v element
-                v_elem = tx_elem.find('.//{' + chart_ns + '}v')
-                if v_elem is not None and v_elem.text:
-                    series_name = v_elem.text
-                else:
-                    # Try strCache -> pt -> v structure
-                    str_cache = tx_elem.find('.//{' + chart_ns + '}strCache')
-                    if str_cache is not None:
-                        pt_elems = str_cache.findall('.//{' + chart_ns + '}pt')
-                        if pt_elems:
-                            v_elem = pt_elems[0].find('.//{' + chart_ns + '}v')
-                            if v_elem is not None and v_elem.text:
-                                series_name = v_elem.text
+                series_name = _first_v_text(tx_elem)
             
             # Get categories (x-axis labels)
-            cat_elem = series.find('.//{' + chart_ns + '}cat')
+            cat_elem = series.find(_ANY_CAT)
             if cat_elem is not None:
-                str_cache = cat_elem.find('.//{' + chart_ns + '}strCache')
+                str_cache = cat_elem.find(_ANY_STRCACHE)
                 if str_cache is not None:
-                    for pt in str_cache.findall('.//{' + chart_ns + '}pt'):
-                        v_elem = pt.find('.//{' + chart_ns + '}v')
+                    for pt in _find_points(str_cache):
+                        v_elem = pt.find(_ANY_V)
                         if v_elem is not None and v_elem.text:
                             categories.append(v_elem.text)
             
             # Get values (y-axis data)
-            val_elem = series.find('.//{' + chart_ns + '}val')
+            val_elem = series.find(_ANY_VAL)
             if val_elem is not None:
                 # Try numCache structure (most common)
-                num_cache = val_elem.find('.//{' + chart_ns + '}numCache')
+                num_cache = val_elem.find(_ANY_NUMCACHE)
                 if num_cache is not None:
-                    for pt in num_cache.findall('.//{' + chart_ns + '}pt'):
+                    for pt in _find_points(num_cache):
                         idx = pt.get('idx', '0')
-                        v_elem = pt.find('.//{' + chart_ns + '}v')
+                        v_elem = pt.find(_ANY_V)
                         if v_elem is not None and v_elem.text:
                             try:
                                 value = float(v_elem.text)
@@ -124,11 +144,11 @@ def parse_chart_xml(zipf, chart_path):
                                 pass
                 
                 # Also check numLit (less common)
-                num_lit = val_elem.find('.//{' + chart_ns + '}numLit')
+                num_lit = val_elem.find(_ANY_NUMLIT)
                 if num_lit is not None and not values:
-                    for pt in num_lit.findall('.//{' + chart_ns + '}pt'):
+                    for pt in _find_points(num_lit):
                         idx = pt.get('idx', '0')
-                        v_elem = pt.find('.//{' + chart_ns + '}v')
+                        v_elem = pt.find(_ANY_V)
                         if v_elem is not None and v_elem.text:
                             try:
                                 value = float(v_elem.text)
@@ -166,18 +186,15 @@ def parse_all_charts(zipf):
     try:
         # Get chart relationships from document relationships
         rels_xml = zipf.read('word/_rels/document.xml.rels')
-        rels_root = ET.fromstring(rels_xml)
-        
-        rel_ns = 'http://schemas.openxmlformats.org/package/2006/relationships'
-        chart_rel_type = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/chart'
+        rels_root = fromstring(rels_xml)
         
         chart_rels = {}
-        for rel in rels_root.findall('.//{' + rel_ns + '}Relationship'):
+        for rel in rels_root.findall(_ANY_RELATIONSHIP):
             rel_id = rel.get('Id')
             rel_type = rel.get('Type', '')
             target = rel.get('Target', '')
             
-            if chart_rel_type in rel_type or 'chart' in rel_type.lower():
+            if _CHART_REL_TYPE in rel_type or 'chart' in rel_type.lower():
                 # Convert relative path to absolute path in ZIP
                 chart_path = target if target.startswith('word/') else f'word/{target}'
                 chart_rels[rel_id] = chart_path
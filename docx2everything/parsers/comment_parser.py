@@ -2,8 +2,17 @@
 Parser for DOCX comments.
 """
 
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import qn, NSMAP
+from ..utils.xml_utils import qn, NSMAP, fromstring, ParseError
+
+# Precomputed tag/attribute names, resolved once instead of being
+# rebuilt per element inside the extraction loops
+_W_ID = qn('w:id')
+_W_AUTHOR = qn('w:author')
+_W_DATE = qn('w:date')
+_W_COMMENT = qn('w:comment')
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
 
 
 def parse_comments_xml(zipf):
@@ -20,23 +29,25 @@ def parse_comments_xml(zipf):
     
     try:
         comments_xml = zipf.read('word/comments.xml')
-        root = ET.fromstring(comments_xml)
+        root = fromstring(comments_xml)
         
-        for comment in root.findall('.//{' + NSMAP['w'] + '}comment'):
-            comment_id = comment.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-            author = comment.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author', 'Unknown')
-            date = comment.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date', '')
-            
-            # Extract text from paragraphs in comment
-            comment_text = ''
-            for para in comment.findall('.//{' + NSMAP['w'] + '}p'):
-                for run in para.findall('.//{' + NSMAP['w'] + '}r'):
-                    for t in run.findall('.//{' + NSMAP['w'] + '}t'):
-                        if t.text:
-                            comment_text += t.text
-                    for br in run.findall('.//{' + NSMAP['w'] + '}br'):
-                        comment_text += '\n'
-                comment_text += '\n'
+        for comment in root.iter(_W_COMMENT):
+            comment_id = comment.get(_W_ID)
+            author = comment.get(_W_AUTHOR, 'Unknown')
+            date = comment.get(_W_DATE, '')
+
+            # Extract text from paragraphs in comment: one descendant walk
+            # per paragraph instead of nested findall searches
+            text_parts = []
+            for para in comment.iter(_W_P):
+                for node in para.iter():
+                    if node.tag == _W_T:
+                        if node.text:
+                            text_parts.append(node.text)
+                    elif node.tag == _W_BR:
+                        text_parts.append('\n')
+                text_parts.append('\n')
+            comment_text = ''.join(text_parts)
             
             if comment_text.strip():
                 comments[comment_id] = {
@@ -44,7 +55,7 @@ def parse_comments_xml(zipf):
                     'author': author,
                     'date': date
                 }
-    except (KeyError, ET.ParseError):
+    except (KeyError, ParseError):
         # If comments.xml doesn't exist or can't be parsed
         pass
     
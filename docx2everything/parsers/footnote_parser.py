@@ -2,8 +2,16 @@
 Parser for DOCX footnotes and endnotes.
 """
 
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import qn, NSMAP
+from ..utils.xml_utils import qn, NSMAP, fromstring, ParseError
+
+# Precomputed tag/attribute names, resolved once instead of being
+# rebuilt per element inside the extraction loops
+_W_ID = qn('w:id')
+_W_FOOTNOTE = qn('w:footnote')
+_W_ENDNOTE = qn('w:endnote')
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
 
 
 def parse_footnotes_xml(zipf):
@@ -20,25 +28,27 @@ def parse_footnotes_xml(zipf):
     
     try:
         footnotes_xml = zipf.read('word/footnotes.xml')
-        root = ET.fromstring(footnotes_xml)
+        root = fromstring(footnotes_xml)
         
-        for footnote in root.findall('.//{' + NSMAP['w'] + '}footnote'):
-            footnote_id = footnote.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-            
-            # Extract text from paragraphs in footnote
-            footnote_text = ''
-            for para in footnote.findall('.//{' + NSMAP['w'] + '}p'):
-                for run in para.findall('.//{' + NSMAP['w'] + '}r'):
-                    for t in run.findall('.//{' + NSMAP['w'] + '}t'):
-                        if t.text:
-                            footnote_text += t.text
-                    for br in run.findall('.//{' + NSMAP['w'] + '}br'):
-                        footnote_text += '\n'
-                footnote_text += '\n'
+        for footnote in root.iter(_W_FOOTNOTE):
+            footnote_id = footnote.get(_W_ID)
+
+            # Extract text from paragraphs in footnote: one descendant walk
+            # per paragraph instead of nested findall searches
+            text_parts = []
+            for para in footnote.iter(_W_P):
+                for node in para.iter():
+                    if node.tag == _W_T:
+                        if node.text:
+                            text_parts.append(node.text)
+                    elif node.tag == _W_BR:
+                        text_parts.append('\n')
+                text_parts.append('\n')
+            footnote_text = ''.join(text_parts)
             
             if footnote_text.strip():
                 footnotes[footnote_id] = footnote_text.strip()
-    except (KeyError, ET.ParseError):
+    except (KeyError, ParseError):
         # If footnotes.xml doesn't exist or can't be parsed
         pass
     
@@ -59,25 +69,27 @@ def parse_endnotes_xml(zipf):
     
     try:
         endnotes_xml = zipf.read('word/endnotes.xml')
-        root = ET.fromstring(endnotes_xml)
+        root = fromstring(endnotes_xml)
         
-        for endnote in root.findall('.//{' + NSMAP['w'] + '}endnote'):
-            endnote_id = endnote.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id')
-            
-            # Extract text from paragraphs in endnote
-            endnote_text = ''
-            for para in endnote.findall('.//{' + NSMAP['w'] + '}p'):
-                for run in para.findall('.//{' + NSMAP['w'] + '}r'):
-                    for t in run.findall('.//{' + NSMAP['w'] + '}t'):
-                        if t.text:
-                            endnote_text += t.text
-                    for br in run.findall('.//{' + NSMAP['w'] + '}br'):
-                        endnote_text += '\n'
-                endnote_text += '\n'
+        for endnote in root.iter(_W_ENDNOTE):
+            endnote_id = endnote.get(_W_ID)
+
+            # Extract text from paragraphs in endnote: one descendant walk
+            # per paragraph instead of nested findall searches
+            text_parts = []
+            for para in endnote.iter(_W_P):
+                for node in para.iter():
+                    if node.tag == _W_T:
+                        if node.text:
+                            text_parts.append(node.text)
+                    elif node.tag == _W_BR:
+                        text_parts.append('\n')
+                text_parts.append('\n')
+            endnote_text = ''.join(text_parts)
             
             if endnote_text.strip():
                 endnotes[endnote_id] = endnote_text.strip()
-    except (KeyError, ET.ParseError):
+    except (KeyError, ParseError):
         # If endnotes.xml doesn't exist or can't be parsed
         pass
     
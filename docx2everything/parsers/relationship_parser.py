@@ -2,42 +2,64 @@
 Parser for DOCX relationship files to resolve hyperlinks and images.
 """
 
-import xml.etree.ElementTree as ET
+from collections import defaultdict
+from xml.parsers import expat
+
+# Relationship elements are in the package namespace; with expat's
+# namespace processing the element name arrives as 'uri}local'
+_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_REL_ELEMENT = _REL_NS + '}Relationship'
+
+
+def parse_relationship_buckets(zipf, rel_file='word/_rels/document.xml.rels'):
+    """
+    Parses a relationship file into per-kind buckets.
+
+    Every relationship is recorded, keyed on the last path segment of
+    its Type URI ('hyperlink', 'image', 'footnotes', ...), so new
+    relationship kinds are available to callers without touching the
+    parse loop. The file is flat attribute-only XML, so it's fed through
+    expat callbacks directly: no element tree is ever allocated.
+
+    Args:
+        zipf: ZipFile object of the DOCX file
+        rel_file: Path to the relationship file within the DOCX
+
+    Returns:
+        dict: Mapping of relationship kind to {relationship ID: target}
+    """
+    buckets = defaultdict(dict)
+
+    try:
+        rels_xml = zipf.read(rel_file)
+
+        def _start(name, attrs):
+            if name == _REL_ELEMENT:
+                # The relationship kind is the last path segment of the
+                # Type URI; bucketing on it directly replaces a lowercase
+                # pass plus two substring scans per relationship
+                kind = attrs.get('Type', '').rsplit('/', 1)[-1]
+                buckets[kind][attrs.get('Id')] = attrs.get('Target', '')
+
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.StartElementHandler = _start
+        parser.Parse(rels_xml, True)
+    except (KeyError, expat.ExpatError):
+        buckets.clear()  # Drop any partial state from a malformed file
+
+    return buckets
 
 
 def parse_relationships(zipf, rel_file='word/_rels/document.xml.rels'):
     """
     Parses relationship files to resolve hyperlinks and images.
-    
+
     Args:
         zipf: ZipFile object of the DOCX file
         rel_file: Path to the relationship file within the DOCX
-    
+
     Returns:
         tuple: (hyperlinks_dict, images_dict) mapping relationship IDs to URLs/paths
     """
-    hyperlinks = {}
-    images = {}
-    
-    try:
-        rels_xml = zipf.read(rel_file)
-        root = ET.fromstring(rels_xml)
-        
-        # Relationship elements are in the package namespace
-        rel_ns = 'http://schemas.openxmlformats.org/package/2006/relationships'
-        
-        for rel in root.findall('.//{' + rel_ns + '}Relationship'):
-            rel_id = rel.get('Id')
-            rel_type = rel.get('Type', '')
-            target = rel.get('Target', '')
-            
-            if ('hyperlink' in rel_type.lower() or 
-                'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink' in rel_type):
-                hyperlinks[rel_id] = target
-            elif ('image' in rel_type.lower() or 
-                  'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image' in rel_type):
-                images[rel_id] = target
-    except (KeyError, ET.ParseError):
-        pass
-    
-    return hyperlinks, images
+    buckets = parse_relationship_buckets(zipf, rel_file)
+    return buckets.get('hyperlink', {}), buckets.get('image', {})
@@ -2,72 +2,132 @@
 Parser for DOCX styles.xml to understand custom styles and formatting.
 """
 
-import xml.etree.ElementTree as ET
-from ..utils.xml_utils import NSMAP
+import re
+from io import BytesIO
+
+from ..utils.xml_utils import (
+    iterparse,
+    ParseError,
+    W_STYLE,
+    W_STYLE_ID,
+    W_TYPE,
+    W_NAME,
+    W_BASED_ON,
+    W_VAL,
+)
+
+# Heading level in a style name ('Heading 1', 'heading2', ...), matched
+# with one compiled search instead of twelve substring tests per style
+_HEADING_RE = re.compile(r'heading\s*([1-6])')
+
+
+class StyleInfo(object):
+    """
+    Parsed record for one w:style element.
+
+    __slots__ keeps per-style memory near a tuple's and makes the
+    attribute reads in the per-paragraph heading path cheaper than
+    string-key dict lookups.
+    """
+
+    __slots__ = ('type', 'name', 'based_on', 'is_heading', 'heading_level')
+
+    def __init__(self, type=None, name=None, based_on=None,
+                 is_heading=False, heading_level=None):
+        self.type = type
+        self.name = name
+        self.based_on = based_on
+        self.is_heading = is_heading
+        self.heading_level = heading_level
 
 
 def parse_styles_xml(zipf):
     """
     Parses styles.xml to extract style information.
-    
+
     Args:
         zipf: ZipFile object of the DOCX file
-    
+
     Returns:
-        dict: Mapping of style ID to style information (name, type, based_on, etc.)
+        dict: Mapping of style ID to StyleInfo records (name, type, based_on, etc.)
     """
     styles = {}
-    
+
     try:
         styles_xml = zipf.read('word/styles.xml')
-        root = ET.fromstring(styles_xml)
-        
-        for style in root.findall('.//{' + NSMAP['w'] + '}style'):
-            style_id = style.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}styleId')
-            style_type = style.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}type')
-            
-            style_info = {
-                'type': style_type,
-                'name': None,
-                'based_on': None,
-                'is_heading': False,
-                'heading_level': None
-            }
-            
-            # Get style name
-            name_elem = style.find('{' + NSMAP['w'] + '}name')
+
+        # Stream the styles instead of materializing the whole tree;
+        # each style element is released as soon as it's been recorded,
+        # so peak memory stays bounded on large style galleries. With
+        # lxml the parser only reports w:style elements at C level.
+        for _event, style in iterparse(BytesIO(styles_xml), ('end',), tag=W_STYLE):
+            if style.tag != W_STYLE:
+                continue
+
+            style_id = style.get(W_STYLE_ID)
+
+            # Collect fields in locals and build the style record in one
+            # literal at the end; repeated dict-key stores on a
+            # half-populated dict are pure interpreter overhead
+            name = None
+            name_elem = style.find(W_NAME)
             if name_elem is not None:
-                style_info['name'] = name_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-            
-            # Get basedOn style
-            based_on_elem = style.find('{' + NSMAP['w'] + '}basedOn')
-            if based_on_elem is not None:
-                style_info['based_on'] = based_on_elem.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val')
-            
+                name = name_elem.get(W_VAL)
+
+            based_on_elem = style.find(W_BASED_ON)
+            based_on = based_on_elem.get(W_VAL) if based_on_elem is not None else None
+
             # Check if it's a heading style
-            if style_info['name']:
-                name_lower = style_info['name'].lower()
+            is_heading = False
+            heading_level = None
+            if name:
+                name_lower = name.lower()
                 if 'heading' in name_lower or 'title' in name_lower:
-                    style_info['is_heading'] = True
+                    is_heading = True
                     # Try to extract heading level
-                    for i in range(1, 7):
-                        if f'heading{i}' in name_lower or f'heading {i}' in name_lower:
-                            style_info['heading_level'] = i
-                            break
-                    if 'title' in name_lower and style_info['heading_level'] is None:
-                        style_info['heading_level'] = 1
-            
-            # Also check based_on style recursively
-            if style_info['based_on'] and style_info['based_on'] in styles:
-                based_on_info = styles[style_info['based_on']]
-                if based_on_info.get('is_heading'):
-                    style_info['is_heading'] = True
-                    style_info['heading_level'] = based_on_info.get('heading_level')
-            
+                    match = _HEADING_RE.search(name_lower)
+                    if match:
+                        heading_level = int(match.group(1))
+                    elif 'title' in name_lower:
+                        heading_level = 1
+
             if style_id:
-                styles[style_id] = style_info
-    except (KeyError, ET.ParseError):
+                styles[style_id] = StyleInfo(
+                    type=style.get(W_TYPE),
+                    name=name,
+                    based_on=based_on,
+                    is_heading=is_heading,
+                    heading_level=heading_level
+                )
+
+            # Fully recorded; free the subtree (and, with lxml, the
+            # already-processed siblings hanging off the root)
+            style.clear()
+            if hasattr(style, 'getprevious'):
+                while style.getprevious() is not None:
+                    del style.getparent()[0]
+    except (KeyError, ParseError):
         # If styles.xml doesn't exist or can't be parsed
         pass
-    
+
+    # Second pass: resolve basedOn inheritance. Doing this after all
+    # styles are collected also catches children declared before their
+    # parents, which the old in-loop lookup silently missed. A visited
+    # set guards against basedOn cycles in malformed documents.
+    for style_info in styles.values():
+        if style_info.is_heading:
+            continue
+        based_on = style_info.based_on
+        seen = set()
+        while based_on and based_on not in seen:
+            seen.add(based_on)
+            parent = styles.get(based_on)
+            if parent is None:
+                break
+            if parent.is_heading:
+                style_info.is_heading = True
+                style_info.heading_level = parent.heading_level
+                break
+            based_on = parent.based_on
+
     return styles
@@ -2,25 +2,88 @@
 XML utility functions for parsing DOCX files.
 """
 
+from functools import lru_cache
+
+try:
+    # lxml's C-backed parser and traversal are much faster than stdlib
+    # ElementTree for large documents; fall back if lxml isn't installed.
+    from lxml import etree as ET
+    HAVE_LXML = True
+    ParseError = ET.XMLSyntaxError
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+    ParseError = ET.ParseError
+
+if HAVE_LXML:
+    # One shared parser amortizes parser setup across every XML part of
+    # the archive. huge_tree lifts lxml's node cap for unusually large
+    # DOCX; external entities are never needed for WordprocessingML.
+    _PARSER = ET.XMLParser(huge_tree=True, resolve_entities=False)
+
+    def fromstring(data):
+        """Parses XML bytes with the shared parser."""
+        return ET.fromstring(data, _PARSER)
+
+    def iterparse(stream, events, tag=None):
+        """
+        Incrementally parses an XML stream. With lxml, ``tag`` restricts
+        the reported events to the given tag names at C level.
+        """
+        if tag is not None:
+            return ET.iterparse(stream, events=events, huge_tree=True, tag=tag)
+        return ET.iterparse(stream, events=events, huge_tree=True)
+else:
+    fromstring = ET.fromstring
+
+    def iterparse(stream, events, tag=None):
+        """
+        Incrementally parses an XML stream. ``tag`` is accepted for API
+        parity but stdlib ElementTree cannot filter, so callers must
+        still dispatch on the tag themselves.
+        """
+        return ET.iterparse(stream, events=events)
+
 NSMAP = {
     'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
     'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
 }
 
 
+@lru_cache(maxsize=None)
 def qn(tag):
     """
     Stands for 'qualified name', a utility function to turn a namespace
     prefixed tag name into a Clark-notation qualified tag name.
-    
+
+    The handful of tag names used in a DOCX repeats constantly, so the
+    split/format work is cached; repeat calls are one dict lookup.
+
     Example: ``qn('w:p')`` returns ``'{http://schemas.../main}p'``
-    
+
     Args:
         tag: A namespace-prefixed tag name (e.g., 'w:p', 'w:t')
-    
+
     Returns:
         A Clark-notation qualified tag name
     """
     prefix, tagroot = tag.split(':')
     uri = NSMAP[prefix]
     return '{{{}}}{}'.format(uri, tagroot)
+
+
+# Clark-notation names shared by the numbering and style parsers,
+# resolved once at import time instead of concatenated per element
+W_NS = NSMAP['w']
+W_NUM = qn('w:num')
+W_NUMID = qn('w:numId')
+W_ABSTRACT_NUM = qn('w:abstractNum')
+W_ABSTRACT_NUM_ID = qn('w:abstractNumId')
+W_LVL = qn('w:lvl')
+W_NUM_FMT = qn('w:numFmt')
+W_VAL = qn('w:val')
+W_STYLE = qn('w:style')
+W_STYLE_ID = qn('w:styleId')
+W_TYPE = qn('w:type')
+W_NAME = qn('w:name')
+W_BASED_ON = qn('w:basedOn')